@@ -25,55 +25,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Soccer Team": {
         "description": "Join the school soccer team and compete in inter-school matches",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
+        "participants": {"alex@mergington.edu", "sarah@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Practice basketball skills and participate in tournaments",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "emily@mergington.edu"]
+        "participants": {"james@mergington.edu", "emily@mergington.edu"}
     },
     "Art Club": {
         "description": "Explore painting, drawing, and various artistic mediums",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["lily@mergington.edu", "noah@mergington.edu"]
+        "participants": {"lily@mergington.edu", "noah@mergington.edu"}
     },
     "Drama Club": {
         "description": "Acting, theater production, and performance arts",
         "schedule": "Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["ava@mergington.edu", "ethan@mergington.edu"]
+        "participants": {"ava@mergington.edu", "ethan@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking through competitive debates",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["mia@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"mia@mergington.edu", "lucas@mergington.edu"}
     },
     "Science Club": {
         "description": "Conduct experiments and explore scientific concepts",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["isabella@mergington.edu", "william@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "william@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
@@ -84,12 +84,16 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities() -> dict[str, dict]:
+    # Participants are stored as sets; return them as sorted lists for JSON
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str) -> dict[str, str | list[str]]:
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -104,12 +108,15 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     
     # Add student
-    activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+    activity["participants"].add(email)
+    return {
+        "message": f"Signed up {email} for {activity_name}",
+        "participants": sorted(activity["participants"])
+    }
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str) -> dict[str, str | list[str]]:
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -123,5 +130,8 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student not registered for this activity")
     
     # Remove student
-    activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+    activity["participants"].discard(email)
+    return {
+        "message": f"Unregistered {email} from {activity_name}",
+        "participants": sorted(activity["participants"])
+    }
@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the High School Management System API tests
+"""
+
+import sys
+
+import httpx
+import pytest
+
+
+if sys.platform == "linux":
+    import uvloop
+
+    # optionalhook: pytest-asyncio < 1.4 has no such hook and keeps its default loop
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop instead of the default asyncio loop"""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Import the FastAPI app once per test process
+
+    Under pytest-xdist every worker is its own process, so each worker gets its
+    own app and activities database and tests never share state across workers.
+    """
+    from src.app import app
+    return app
+
+
+@pytest.fixture(scope="session")
+def activities():
+    """The in-memory activity database of this worker's app"""
+    from src.app import activities
+    return activities
+
+
+@pytest.fixture(scope="session")
+async def client(app_instance):
+    """Create a single async client for the FastAPI app, shared by all tests"""
+    transport = httpx.ASGITransport(app=app_instance)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
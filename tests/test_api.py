@@ -2,50 +2,83 @@
 Tests for the High School Management System API endpoints
 """
 
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+# Seed data restored before each test
+_ACTIVITIES_TEMPLATE = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Soccer Team": {
+        "description": "Join the school soccer team and compete in inter-school matches",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
+        "max_participants": 25,
+        "participants": {"alex@mergington.edu", "sarah@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": set()
+    }
+}
+
+SIGNUP_URL = "/activities/{a}/signup?email={e}"
+UNREGISTER_URL = "/activities/{a}/unregister?email={e}"
+
+# URL-quoted path segment for each activity name used in the tests
+ACTIVITY_PATHS = {
+    name: quote(name) for name in (*_ACTIVITIES_TEMPLATE, "Nonexistent Club")
+}
+
+SPECIAL_EMAIL = "test.user@mergington.edu"
+SPECIAL_EMAIL_QUOTED = quote(SPECIAL_EMAIL)
+
+
+def _fresh():
+    """Copy the seed data, giving each activity its own participants set"""
+    return {
+        name: {**details, "participants": set(details["participants"])}
+        for name, details in _ACTIVITIES_TEMPLATE.items()
+    }
+
+
+def _seed_activities(activities):
+    """Restore the activities database to the seed data"""
+    activities.clear()
+    activities.update(_fresh())
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
+def reset_activities(activities):
     """Reset activities data before each test"""
-    activities.clear()
-    activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in inter-school matches",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": []
-        }
-    })
+    _seed_activities(activities)
     yield
 
 
+@pytest.fixture(scope="class")
+async def activities_snapshot(client, activities):
+    """Fetch GET /activities for the seed data once per test class
+
+    Only for read-only tests: the returned dict is shared by every test in the class.
+    """
+    _seed_activities(activities)
+    response = await client.get("/activities")
+    return response.json()
+
+
 class TestRootEndpoint:
     """Tests for the root endpoint"""
 
-    def test_root_redirects_to_static(self, client):
+    async def test_root_redirects_to_static(self, client):
         """Test that the root endpoint redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -53,20 +86,18 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
 
-    def test_get_activities_success(self, client):
+    async def test_get_activities_success(self, client):
         """Test getting all activities"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
-        data = response.json()
-        assert "Chess Club" in data
-        assert "Soccer Team" in data
-        assert "Programming Class" in data
+        assert b'"Chess Club"' in response.content
+        assert b'"Soccer Team"' in response.content
+        assert b'"Programming Class"' in response.content
 
-    def test_get_activities_structure(self, client):
+    async def test_get_activities_structure(self, activities_snapshot):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        data = activities_snapshot
+
         chess_club = data["Chess Club"]
         assert "description" in chess_club
         assert "schedule" in chess_club
@@ -74,11 +105,10 @@ class TestGetActivities:
         assert "participants" in chess_club
         assert isinstance(chess_club["participants"], list)
 
-    def test_get_activities_participants(self, client):
+    async def test_get_activities_participants(self, activities_snapshot):
         """Test that participant lists are correct"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        data = activities_snapshot
+
         assert len(data["Chess Club"]["participants"]) == 2
         assert "michael@mergington.edu" in data["Chess Club"]["participants"]
         assert len(data["Programming Class"]["participants"]) == 0
@@ -87,154 +117,123 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_success(self, client):
-        """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Programming%20Class/signup?email=john@mergington.edu"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "john@mergington.edu" in data["message"]
-        assert "Programming Class" in data["message"]
+    @pytest.mark.parametrize("activity,emails", [
+        ("Programming Class", ["john@mergington.edu"]),
+        ("Soccer Team", ["jane@mergington.edu"]),
+        ("Programming Class", [
+            "student1@mergington.edu",
+            "student2@mergington.edu",
+            "student3@mergington.edu",
+        ]),
+    ])
+    async def test_signup_adds_participants(self, client, activity, emails):
+        """Test successful signups are acknowledged and returned in the participant list"""
+        for email in emails:
+            response = await client.post(SIGNUP_URL.format(a=ACTIVITY_PATHS[activity], e=email))
+            assert response.status_code == 200
+            data = response.json()
+            assert "message" in data
+            assert email in data["message"]
+            assert activity in data["message"]
 
-    def test_signup_adds_participant(self, client):
-        """Test that signup actually adds the participant"""
-        client.post("/activities/Programming%20Class/signup?email=jane@mergington.edu")
-        
-        response = client.get("/activities")
-        data = response.json()
-        assert "jane@mergington.edu" in data["Programming Class"]["participants"]
+        for email in emails:
+            assert email in data["participants"]
 
-    def test_signup_duplicate_fails(self, client):
+    async def test_signup_duplicate_fails(self, client):
         """Test that signing up twice fails"""
         email = "alice@mergington.edu"
-        client.post(f"/activities/Chess%20Club/signup?email={email}")
+        await client.post(SIGNUP_URL.format(a=ACTIVITY_PATHS["Chess Club"], e=email))
         
         # Try to sign up again
-        response = client.post(f"/activities/Chess%20Club/signup?email={email}")
+        response = await client.post(SIGNUP_URL.format(a=ACTIVITY_PATHS["Chess Club"], e=email))
         assert response.status_code == 400
         data = response.json()
         assert "already signed up" in data["detail"].lower()
 
-    def test_signup_nonexistent_activity(self, client):
+    async def test_signup_nonexistent_activity(self, client):
         """Test signup for non-existent activity fails"""
-        response = client.post(
-            "/activities/Nonexistent%20Club/signup?email=test@mergington.edu"
+        response = await client.post(
+            SIGNUP_URL.format(a=ACTIVITY_PATHS["Nonexistent Club"], e="test@mergington.edu")
         )
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    def test_signup_multiple_students(self, client):
-        """Test signing up multiple students"""
-        emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
-        
-        for email in emails:
-            response = client.post(f"/activities/Programming%20Class/signup?email={email}")
-            assert response.status_code == 200
-        
-        response = client.get("/activities")
-        data = response.json()
-        participants = data["Programming Class"]["participants"]
-        
-        for email in emails:
-            assert email in participants
-
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_success(self, client):
-        """Test successful unregistration from an activity"""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
-        )
+    @pytest.mark.parametrize("activity,email,remaining", [
+        ("Chess Club", "michael@mergington.edu", "daniel@mergington.edu"),
+        ("Soccer Team", "sarah@mergington.edu", "alex@mergington.edu"),
+    ])
+    async def test_unregister_removes_participant(self, client, activity, email, remaining):
+        """Test successful unregistration is acknowledged and drops only that participant"""
+        response = await client.delete(UNREGISTER_URL.format(a=ACTIVITY_PATHS[activity], e=email))
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
-        assert "michael@mergington.edu" in data["message"]
-        assert "Chess Club" in data["message"]
-
-    def test_unregister_removes_participant(self, client):
-        """Test that unregister actually removes the participant"""
-        client.delete("/activities/Chess%20Club/unregister?email=michael@mergington.edu")
-        
-        response = client.get("/activities")
-        data = response.json()
-        assert "michael@mergington.edu" not in data["Chess Club"]["participants"]
-        assert "daniel@mergington.edu" in data["Chess Club"]["participants"]
+        assert email in data["message"]
+        assert activity in data["message"]
+        assert email not in data["participants"]
+        assert remaining in data["participants"]
 
-    def test_unregister_not_registered_fails(self, client):
+    async def test_unregister_not_registered_fails(self, client):
         """Test that unregistering a non-participant fails"""
-        response = client.delete(
-            "/activities/Programming%20Class/unregister?email=notregistered@mergington.edu"
+        response = await client.delete(
+            UNREGISTER_URL.format(
+                a=ACTIVITY_PATHS["Programming Class"], e="notregistered@mergington.edu"
+            )
         )
         assert response.status_code == 400
         data = response.json()
         assert "not registered" in data["detail"].lower()
 
-    def test_unregister_nonexistent_activity(self, client):
+    async def test_unregister_nonexistent_activity(self, client):
         """Test unregister for non-existent activity fails"""
-        response = client.delete(
-            "/activities/Nonexistent%20Club/unregister?email=test@mergington.edu"
+        response = await client.delete(
+            UNREGISTER_URL.format(a=ACTIVITY_PATHS["Nonexistent Club"], e="test@mergington.edu")
         )
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    def test_signup_and_unregister_workflow(self, client):
+    async def test_signup_and_unregister_workflow(self, client):
         """Test complete signup and unregister workflow"""
         email = "workflow@mergington.edu"
-        activity = "Programming%20Class"
+        activity = "Programming Class"
         
         # Sign up
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+        response = await client.post(SIGNUP_URL.format(a=ACTIVITY_PATHS[activity], e=email))
         assert response.status_code == 200
         
-        # Verify signup
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Programming Class"]["participants"]
-        
         # Unregister
-        response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        response = await client.delete(UNREGISTER_URL.format(a=ACTIVITY_PATHS[activity], e=email))
         assert response.status_code == 200
-        
-        # Verify unregistration
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Programming Class"]["participants"]
 
 
 class TestEdgeCases:
     """Tests for edge cases and data validation"""
 
-    def test_activity_participant_count(self, client):
+    async def test_activity_participant_count(self, activities_snapshot):
         """Test that participant count matches list length"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        data = activities_snapshot
+
         for activity_name, activity_data in data.items():
             assert len(activity_data["participants"]) <= activity_data["max_participants"]
 
-    def test_special_characters_in_email(self, client):
+    async def test_special_characters_in_email(self, client):
         """Test handling of special characters in email"""
-        from urllib.parse import quote
-        email = "test.user@mergington.edu"
-        encoded_email = quote(email)
-        response = client.post(f"/activities/Programming%20Class/signup?email={encoded_email}")
+        response = await client.post(
+            SIGNUP_URL.format(a=ACTIVITY_PATHS["Programming Class"], e=SPECIAL_EMAIL_QUOTED)
+        )
         assert response.status_code == 200
-        
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Programming Class"]["participants"]
+        assert SPECIAL_EMAIL in response.json()["participants"]
 
-    def test_activity_names_with_spaces(self, client):
+    async def test_activity_names_with_spaces(self, activities_snapshot):
         """Test that activity names with spaces work correctly"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        data = activities_snapshot
+
         # Verify activities with spaces exist
         assert "Chess Club" in data
         assert "Soccer Team" in data